@@ -1,5 +1,6 @@
 """Bot orchestrator module."""
 
+from src.bot.bot_pool import LinkedInBotPool
 from src.bot.linkedin_bot import LinkedInBot
 
-__all__ = ["LinkedInBot"]
+__all__ = ["LinkedInBot", "LinkedInBotPool"]
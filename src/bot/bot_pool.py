@@ -0,0 +1,225 @@
+"""
+Pool of LinkedIn logins sharing a single browser.
+
+This module provides the LinkedInBotPool class that runs logins for several
+accounts concurrently, each in its own isolated browser context.
+"""
+
+import asyncio
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from playwright.async_api import BrowserContext
+
+from src.bot.session import load_saved_session, restore_session, save_session
+from src.config.constants import LOG_TIMESTAMP_FORMAT, SESSION_DIR
+from src.config.settings import Settings, get_settings
+from src.core.browser_manager import BrowserManager
+from src.exceptions import BrowserInitializationException
+from src.pages.login_page import LoginPage
+from src.utils.logger import get_logger
+from src.utils.screenshot_manager import ScreenshotManager
+
+logger = get_logger(__name__)
+
+
+class LinkedInBotPool:
+    """
+    Runs logins for multiple accounts on one shared browser.
+
+    Every account gets its own browser context, so cookies and storage are
+    isolated, while the Playwright driver and Chromium process are started
+    only once. A semaphore bounds how many logins run at the same time.
+    Each account's session is saved after login and reused on later runs,
+    and each login writes screenshots to its own session directory.
+
+    Attributes:
+        settings: Configuration settings.
+        browser_manager: Singleton browser manager instance.
+        max_concurrent: Maximum number of concurrent logins.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        max_concurrent: Optional[int] = None,
+    ):
+        """
+        Initialize the bot pool.
+
+        Args:
+            settings: Optional Settings instance. If not provided, uses default.
+            max_concurrent: Maximum concurrent logins (overrides settings).
+        """
+        self.settings = settings or get_settings()
+        self.browser_manager: Optional[BrowserManager] = None
+        self.max_concurrent = max_concurrent or self.settings.max_concurrent
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        # Contexts opened by this pool, and whether the pool launched the
+        # (shared) browser itself
+        self._contexts: set[BrowserContext] = set()
+        self._owns_browser = False
+
+        logger.info(f"LinkedInBotPool created (max_concurrent={self.max_concurrent})")
+
+    async def initialize(
+        self,
+        headless: Optional[bool] = None,
+        slow_mo: Optional[int] = None,
+    ) -> None:
+        """
+        Launch the shared browser, or reuse it if it is already running.
+
+        Args:
+            headless: Override headless mode setting.
+            slow_mo: Override slow motion setting.
+
+        Raises:
+            BrowserInitializationException: If browser initialization fails.
+        """
+        self.browser_manager = await BrowserManager.get_instance()
+        self._owns_browser = self.browser_manager.browser is None
+        await self.browser_manager.launch(headless=headless, slow_mo=slow_mo)
+
+    async def login_all(
+        self,
+        accounts: list[tuple[str, str]],
+        handle_challenges: bool = True,
+    ) -> dict[str, bool | Exception]:
+        """
+        Log in to all accounts concurrently.
+
+        Args:
+            accounts: List of (email, password) pairs.
+            handle_challenges: Whether to detect and report challenges.
+
+        Returns:
+            Mapping of email to login result, or the exception that login raised.
+
+        Raises:
+            BrowserInitializationException: If the pool is not initialized.
+        """
+        if not self.browser_manager or not self.browser_manager.browser:
+            raise BrowserInitializationException("Bot pool not initialized")
+
+        logger.info(f"Logging in {len(accounts)} accounts")
+
+        results = await asyncio.gather(
+            *(
+                self._login_one(email, password, handle_challenges)
+                for email, password in accounts
+            ),
+            return_exceptions=True,
+        )
+
+        return {email: result for (email, _), result in zip(accounts, results)}
+
+    async def _login_one(
+        self,
+        email: str,
+        password: str,
+        handle_challenges: bool,
+    ) -> bool:
+        """
+        Log in to a single account in a fresh browser context.
+
+        A saved session for the account is tried first; the login form is
+        only used when it is missing or expired.
+
+        Args:
+            email: LinkedIn email.
+            password: LinkedIn password.
+            handle_challenges: Whether to detect and report challenges.
+
+        Returns:
+            True if login successful, False otherwise.
+        """
+        async with self._semaphore:
+            logger.info(f"Logging in with email: {email[:3]}***")
+            account_id = self._account_id(email)
+            state_file = SESSION_DIR / f"linkedin_state_{account_id}.json"
+            storage_state = load_saved_session(state_file)
+            context = await self.browser_manager.create_context(storage_state)
+            self._contexts.add(context)
+
+            # A screenshot manager per login, so its dedup can never hand back
+            # another account's screenshot
+            screenshot_manager = ScreenshotManager()
+            timestamp = datetime.now().strftime(LOG_TIMESTAMP_FORMAT)
+            screenshot_manager.create_session_directory(f"{timestamp}_{account_id}")
+
+            try:
+                page = await context.new_page()
+
+                if storage_state and await restore_session(page):
+                    return True
+
+                # No manual challenge solving when several logins run at once
+                success = await LoginPage(page, screenshot_manager).login(
+                    email=email,
+                    password=password,
+                    handle_challenges=handle_challenges,
+                    wait_time_on_challenge=0,
+                )
+
+                if success:
+                    await save_session(context, state_file)
+
+                return success
+
+            finally:
+                self._contexts.discard(context)
+                await context.close()
+                await screenshot_manager.flush()
+
+    @staticmethod
+    def _account_id(email: str) -> str:
+        """
+        Get a stable, file-name-safe identifier for an account.
+
+        The email is hashed so it doesn't end up in file names.
+
+        Args:
+            email: LinkedIn email.
+
+        Returns:
+            Short hex digest of the normalized email.
+        """
+        return hashlib.sha256(email.lower().encode("utf-8")).hexdigest()[:16]
+
+    async def cleanup(self) -> None:
+        """
+        Clean up pool resources.
+
+        Only the contexts this pool opened are closed. The shared browser is
+        closed only if the pool launched it and no bot is still using it.
+        """
+        logger.info("Cleaning up bot pool resources...")
+
+        try:
+            for context in list(self._contexts):
+                await context.close()
+            self._contexts.clear()
+
+            if (
+                self.browser_manager
+                and self._owns_browser
+                and self.browser_manager.context is None
+            ):
+                await self.browser_manager.close()
+
+            logger.info("Bot pool cleanup complete")
+
+        except Exception as e:
+            logger.error(f"Error during cleanup: {e}")
+
+    async def __aenter__(self) -> "LinkedInBotPool":
+        """Context manager entry."""
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        await self.cleanup()
@@ -5,8 +5,11 @@ This module provides the LinkedInBot class that coordinates all bot operations,
 managing the browser, pages, and workflow execution.
 """
 
+from datetime import datetime
 from typing import Optional
 
+from src.bot.session import load_saved_session, restore_session, save_session
+from src.config.constants import LOG_TIMESTAMP_FORMAT, TRACES_DIR
 from src.config.settings import Settings, get_settings
 from src.core.browser_manager import BrowserManager
 from src.exceptions import (
@@ -43,6 +46,17 @@ class LinkedInBot:
         sales_nav_page: Sales Navigator page object.
     """
 
+    __slots__ = (
+        "settings",
+        "browser_manager",
+        "screenshot_manager",
+        "login_page",
+        "feed_page",
+        "sales_nav_page",
+        "_session_restored",
+        "_failed",
+    )
+
     def __init__(self, settings: Optional[Settings] = None):
         """
         Initialize the LinkedIn Bot.
@@ -59,6 +73,12 @@ class LinkedInBot:
         self.feed_page: Optional[FeedPage] = None
         self.sales_nav_page: Optional[SalesNavigatorPage] = None
 
+        # Whether the browser context was started from a saved session
+        self._session_restored = False
+
+        # Whether anything failed this session (keeps the trace on cleanup)
+        self._failed = False
+
         logger.info("LinkedInBot instance created")
 
     async def initialize(
@@ -82,12 +102,17 @@ class LinkedInBot:
             # Create session directory for screenshots
             self.screenshot_manager.create_session_directory()
 
-            # Initialize browser
+            # Initialize browser, starting from a saved session when available
+            storage_state = load_saved_session()
             self.browser_manager = await BrowserManager.get_instance()
+            # An existing context is kept as is, without the saved state
+            context_existed = self.browser_manager.context is not None
             await self.browser_manager.initialize(
                 headless=headless,
                 slow_mo=slow_mo,
+                storage_state=storage_state,
             )
+            self._session_restored = storage_state is not None and not context_existed
 
             # Initialize page objects
             page = await self.browser_manager.get_page()
@@ -110,14 +135,21 @@ class LinkedInBot:
         email: Optional[str] = None,
         password: Optional[str] = None,
         handle_challenges: bool = True,
+        humanize: bool = True,
+        reuse_session: bool = True,
     ) -> bool:
         """
         Perform LinkedIn login.
 
+        If a saved session is available it is restored first, and the login
+        form is only used when that session is missing or no longer valid.
+
         Args:
             email: LinkedIn email (uses settings if not provided).
             password: LinkedIn password (uses settings if not provided).
             handle_challenges: Whether to handle security challenges.
+            humanize: Whether to enter credentials with human-like pacing.
+            reuse_session: Whether to try restoring a saved session first.
 
         Returns:
             True if login successful, False otherwise.
@@ -143,6 +175,9 @@ class LinkedInBot:
                 config_key="credentials",
             )
 
+        if reuse_session and await self._restore_session():
+            return True
+
         logger.info(f"Logging in with email: {login_email[:3]}***")
 
         try:
@@ -152,8 +187,14 @@ class LinkedInBot:
                 password=login_password,
                 handle_challenges=handle_challenges,
                 wait_time_on_challenge=60 if not self.settings.headless else 0,
+                humanize=humanize,
             )
 
+            if success:
+                await self._save_session()
+            else:
+                self._failed = True
+
             return success
 
         except (
@@ -162,15 +203,32 @@ class LinkedInBot:
             UnusualActivityException,
         ) as e:
             logger.error(f"Security challenge during login: {e}")
+            self._failed = True
             raise
 
         except Exception as e:
             logger.error(f"Login failed: {e}")
+            self._failed = True
             raise LoginFailedException(
                 message=f"Login failed: {e}",
                 error_type=type(e).__name__,
             ) from e
 
+    async def _restore_session(self) -> bool:
+        """
+        Check whether the saved session the browser started with is logged in.
+
+        Returns:
+            True if the saved session is still logged in, False otherwise.
+        """
+        if not self._session_restored:
+            return False
+        return await restore_session(self.feed_page.page)
+
+    async def _save_session(self) -> None:
+        """Save the current storage state for reuse on later runs."""
+        await save_session(self.browser_manager.context)
+
     async def navigate_to_feed(self) -> bool:
         """
         Navigate to LinkedIn feed.
@@ -212,13 +270,14 @@ class LinkedInBot:
 
             if success:
                 logger.info("Successfully navigated to Sales Navigator")
-                await self.sales_nav_page.take_screenshot("sales_navigator_loaded")
+            else:
+                self._failed = True
 
             return success
 
         except Exception as e:
             logger.error(f"Failed to navigate to Sales Navigator: {e}")
-            await self.sales_nav_page.take_screenshot("sales_nav_error")
+            self._failed = True
             return False
 
     async def perform_feed_interaction(self, scroll_times: int = 3) -> None:
@@ -292,13 +351,33 @@ class LinkedInBot:
             health["error"] = str(e)
             return health
 
-    async def cleanup(self) -> None:
-        """Clean up bot resources."""
+    async def cleanup(self, keep_browser: bool = False) -> None:
+        """
+        Clean up bot resources.
+
+        The session trace is saved to TRACES_DIR if anything failed and
+        discarded otherwise.
+
+        Args:
+            keep_browser: Close only the browser context and leave the browser
+                running, so the next initialize() in this process starts warm.
+        """
         logger.info("Cleaning up bot resources...")
 
         try:
+            await self.screenshot_manager.flush()
+
             if self.browser_manager:
-                await self.browser_manager.close()
+                trace_path = None
+                if self._failed:
+                    timestamp = datetime.now().strftime(LOG_TIMESTAMP_FORMAT)
+                    trace_path = TRACES_DIR / f"trace_{timestamp}.zip"
+                await self.browser_manager.stop_tracing(trace_path)
+
+                if keep_browser:
+                    await self.browser_manager.close_context()
+                else:
+                    await self.browser_manager.close()
 
             logger.info("Bot cleanup complete")
 
@@ -312,6 +391,8 @@ class LinkedInBot:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
+        if exc_type is not None:
+            self._failed = True
         await self.cleanup()
 
     async def run_demo_workflow(self) -> None:
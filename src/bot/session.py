@@ -0,0 +1,107 @@
+"""
+Saved LinkedIn session handling.
+
+This module loads, verifies and saves Playwright storage state so bots can
+skip the login form when a recent session is still valid.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+from playwright.async_api import BrowserContext, Page
+
+from src.config.constants import (
+    SESSION_AUTH_COOKIE,
+    SESSION_MAX_AGE_SECONDS,
+    SESSION_STATE_FILE,
+)
+from src.pages.feed_page import FeedPage
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def load_saved_session(path: Path = SESSION_STATE_FILE) -> Optional[Path]:
+    """
+    Get a saved session state file if it can be trusted.
+
+    The file must be younger than SESSION_MAX_AGE_SECONDS and contain
+    LinkedIn's auth cookie.
+
+    Args:
+        path: Session state file to check.
+
+    Returns:
+        Path to the session state file, or None if unusable.
+    """
+    try:
+        if not path.exists():
+            return None
+
+        age = time.time() - path.stat().st_mtime
+        if age > SESSION_MAX_AGE_SECONDS:
+            logger.debug("Saved session is too old, ignoring it")
+            return None
+
+        state = json.loads(path.read_text(encoding="utf-8"))
+        cookies = state.get("cookies", [])
+        if not any(c.get("name") == SESSION_AUTH_COOKIE for c in cookies):
+            logger.debug("Saved session has no auth cookie, ignoring it")
+            return None
+
+        return path
+
+    except Exception as e:
+        logger.warning(f"Failed to read saved session: {e}")
+        return None
+
+
+async def restore_session(page: Page) -> bool:
+    """
+    Check whether a context started from a saved session is logged in.
+
+    The feed never goes network-idle, so navigation only waits for the DOM
+    and verify_loaded() waits for the nav bar.
+
+    Args:
+        page: Page in the restored context.
+
+    Returns:
+        True if the saved session is still logged in, False otherwise.
+    """
+    try:
+        feed_page = FeedPage(page)
+        await feed_page.navigate(wait_until="domcontentloaded")
+
+        if await feed_page.verify_loaded():
+            logger.info("Restored saved LinkedIn session")
+            return True
+
+        logger.info("Saved session expired, falling back to login")
+        return False
+
+    except Exception as e:
+        logger.warning(f"Failed to restore saved session: {e}")
+        return False
+
+
+async def save_session(
+    context: BrowserContext,
+    path: Path = SESSION_STATE_FILE,
+) -> None:
+    """
+    Save a context's storage state for reuse on later runs.
+
+    Args:
+        context: Logged-in browser context.
+        path: Where to write the storage state.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await context.storage_state(path=str(path))
+        logger.debug(f"Session saved: {path}")
+
+    except Exception as e:
+        logger.warning(f"Failed to save session: {e}")
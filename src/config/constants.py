@@ -23,6 +23,9 @@ SETTINGS_FILE = CONFIG_DIR / "settings.yaml"
 DATA_DIR = PROJECT_ROOT / "data"
 SCREENSHOTS_DIR = DATA_DIR / "screenshots"
 LOGS_DIR = DATA_DIR / "logs"
+SESSION_DIR = DATA_DIR / "session"
+SESSION_STATE_FILE = SESSION_DIR / "linkedin_state.json"
+TRACES_DIR = DATA_DIR / "traces"
 
 # Source directories
 SRC_DIR = PROJECT_ROOT / "src"
@@ -58,6 +61,25 @@ NON_HEADLESS_ARGS = [
     "--window-position=0,0",
 ]
 
+# Resource types aborted when resource blocking is enabled. Stylesheets are
+# kept because element visibility checks depend on them.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Only requests matching this pattern are routed through the blocking handler
+# (static file extensions, plus LinkedIn's extension-less media CDN)
+BLOCKED_RESOURCE_URL_PATTERN = (
+    r"\.(?:png|jpe?g|gif|webp|avif|svg|ico|bmp|woff2?|ttf|otf|eot"
+    r"|mp4|webm|mp3|m4a|ogg|wav)(?:[?#]|$)"
+    r"|//media\.licdn\.com/"
+)
+
+# Security challenge resources that are never blocked, so humans (and the
+# challenge screenshots) can see CAPTCHA tiles
+RESOURCE_BLOCK_EXEMPT_PATTERN = (
+    r"recaptcha|gstatic\.com|arkoselabs\.com|funcaptcha\.com|hcaptcha\.com"
+    r"|/checkpoint/"
+)
+
 # Default viewport size
 DEFAULT_VIEWPORT_WIDTH = 1920
 DEFAULT_VIEWPORT_HEIGHT = 1080
@@ -101,14 +123,26 @@ MAX_PAGE_LOAD_DELAY = 4_000
 MIN_SCROLL_DELAY = 500
 MAX_SCROLL_DELAY = 2_000
 
+# Upper bound for any random delay in headless fast mode
+FAST_MODE_MAX_DELAY = 500
+
 # Mouse movement
-MIN_MOUSE_STEPS = 5
-MAX_MOUSE_STEPS = 15
+MIN_MOUSE_STEPS = 3
+MAX_MOUSE_STEPS = 8
+MIN_MOUSE_STEP_DELAY = 30
+MAX_MOUSE_STEP_DELAY = 300
 
 # Retry configuration
 MAX_RETRY_ATTEMPTS = 3
 RETRY_DELAY_SECONDS = 10
 
+# ============================================================================
+# CONCURRENCY
+# ============================================================================
+
+# Maximum number of concurrent logins in a bot pool
+DEFAULT_MAX_CONCURRENT_BOTS = 4
+
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -149,24 +183,25 @@ LOG_BACKUP_COUNT = 5
 # SCREENSHOT CONFIGURATION
 # ============================================================================
 
-SCREENSHOT_FORMAT = "png"
-SCREENSHOT_QUALITY = 90
-SCREENSHOT_FULL_PAGE = True
+# Viewport-only JPEGs are much smaller and faster to capture than full-page PNGs
+SCREENSHOT_FORMAT = "jpg"
+SCREENSHOT_QUALITY = 70
+SCREENSHOT_FULL_PAGE = False
 
 # ============================================================================
 # SECURITY CHALLENGE DETECTION
 # ============================================================================
 
 # CAPTCHA selectors
-CAPTCHA_SELECTORS = [
+CAPTCHA_SELECTORS = (
     'iframe[src*="recaptcha"][src*="bframe"]',
     'iframe[title*="recaptcha"]',
     '[id*="captcha"]:visible',
     '[class*="captcha"]:visible',
-]
+)
 
 # 2FA/Verification selectors
-VERIFICATION_SELECTORS = [
+VERIFICATION_SELECTORS = (
     'text=/enter.*verification.*code/i',
     'text=/enter.*security.*code/i',
     'text=/two.*factor/i',
@@ -178,15 +213,15 @@ VERIFICATION_SELECTORS = [
     '[data-test-id*="verification"]',
     'input[id="input__email_verification_pin"]',
     'input[id="input__phone_verification_pin"]',
-]
+)
 
 # Unusual activity warning selectors
-WARNING_SELECTORS = [
+WARNING_SELECTORS = (
     'text=/unusual.*activity/i',
     'text=/suspicious.*activity/i',
     'text=/temporarily.*restricted/i',
     'text=/account.*restricted/i',
-]
+)
 
 # Security challenge types
 CHALLENGE_TYPE_CAPTCHA = "CAPTCHA"
@@ -206,6 +241,10 @@ ENV_TIMEOUT = "TIMEOUT"
 ENV_MAX_LOGIN_ATTEMPTS = "MAX_LOGIN_ATTEMPTS"
 ENV_LOG_LEVEL = "LOG_LEVEL"
 ENV_SLOW_MO = "SLOW_MO"
+ENV_BLOCK_RESOURCES = "BLOCK_RESOURCES"
+ENV_MAX_CONCURRENT = "MAX_CONCURRENT"
+ENV_HEADLESS_FAST = "HEADLESS_FAST"
+ENV_TRACE = "TRACE"
 
 # ============================================================================
 # PAGE IDENTIFIERS
@@ -215,8 +254,19 @@ ENV_SLOW_MO = "SLOW_MO"
 URL_PATTERN_FEED = "feed"
 URL_PATTERN_MY_NETWORK = "mynetwork"
 URL_PATTERN_LOGIN = "login"
+URL_PATTERN_CHECKPOINT = "checkpoint"
 URL_PATTERN_SALES_NAV = "sales"
 
+# ============================================================================
+# SESSION REUSE
+# ============================================================================
+
+# Cookie that carries LinkedIn's authenticated session
+SESSION_AUTH_COOKIE = "li_at"
+
+# Saved sessions older than this are not trusted (LinkedIn session lifetime)
+SESSION_MAX_AGE_SECONDS = 24 * 60 * 60
+
 # ============================================================================
 # TEST CONFIGURATION
 # ============================================================================
@@ -6,6 +6,7 @@ and YAML files, with validation and type checking.
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -17,19 +18,24 @@ from src.config.constants import (
     CONFIG_DIR,
     DEFAULT_GEOLOCATION,
     DEFAULT_LOCALE,
+    DEFAULT_MAX_CONCURRENT_BOTS,
     DEFAULT_TIMEOUT,
     DEFAULT_TIMEZONE,
     DEFAULT_USER_AGENT,
     DEFAULT_VIEWPORT_HEIGHT,
     DEFAULT_VIEWPORT_WIDTH,
+    ENV_BLOCK_RESOURCES,
+    ENV_HEADLESS_FAST,
     ENV_HEADLESS_MODE,
     ENV_LINKEDIN_EMAIL,
     ENV_LINKEDIN_PASSWORD,
     ENV_LOG_LEVEL,
+    ENV_MAX_CONCURRENT,
     ENV_MAX_LOGIN_ATTEMPTS,
     ENV_SALES_NAVIGATOR_URL,
     ENV_SLOW_MO,
     ENV_TIMEOUT,
+    ENV_TRACE,
     LOG_LEVEL_INFO,
     MAX_RETRY_ATTEMPTS,
     SALES_NAVIGATOR_BASE_URL,
@@ -48,9 +54,13 @@ class Settings(BaseSettings):
         linkedin_password: LinkedIn account password.
         sales_navigator_url: Sales Navigator URL.
         headless: Whether to run browser in headless mode.
+        headless_fast: Whether to skip cosmetic human-like behavior when headless.
         slow_mo: Slow motion delay in milliseconds (for debugging).
+        block_resources: Whether to abort image, font and media requests
+            in headless runs.
         timeout: Default timeout in milliseconds.
         max_login_attempts: Maximum number of login retry attempts.
+        max_concurrent: Maximum number of concurrent logins in a bot pool.
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         _settings_yaml: Cached settings from YAML file.
         _selectors_yaml: Cached selectors from YAML file.
@@ -86,6 +96,11 @@ class Settings(BaseSettings):
         alias=ENV_HEADLESS_MODE,
         description="Run browser in headless mode",
     )
+    headless_fast: bool = Field(
+        default=True,
+        alias=ENV_HEADLESS_FAST,
+        description="Skip mouse movement and shorten delays when headless",
+    )
     slow_mo: int = Field(
         default=0,
         alias=ENV_SLOW_MO,
@@ -93,6 +108,16 @@ class Settings(BaseSettings):
         ge=0,
         le=5000,
     )
+    block_resources: bool = Field(
+        default=True,
+        alias=ENV_BLOCK_RESOURCES,
+        description="Abort image, font and media requests in headless runs",
+    )
+    trace: bool = Field(
+        default=True,
+        alias=ENV_TRACE,
+        description="Record a Playwright trace and keep it when a run fails",
+    )
 
     # Timeout settings
     timeout: int = Field(
@@ -112,6 +137,15 @@ class Settings(BaseSettings):
         le=10,
     )
 
+    # Concurrency settings
+    max_concurrent: int = Field(
+        default=DEFAULT_MAX_CONCURRENT_BOTS,
+        alias=ENV_MAX_CONCURRENT,
+        description="Maximum concurrent logins in a bot pool",
+        ge=1,
+        le=32,
+    )
+
     # Logging settings
     log_level: str = Field(
         default=LOG_LEVEL_INFO,
@@ -270,7 +304,7 @@ class Settings(BaseSettings):
             )
         return selectors[page_name]
 
-    @property
+    @cached_property
     def viewport_size(self) -> dict[str, int]:
         """Get viewport size from browser config."""
         browser_config = self.get_browser_config()
@@ -279,25 +313,25 @@ class Settings(BaseSettings):
             "height": browser_config.get("viewport_height", DEFAULT_VIEWPORT_HEIGHT),
         }
 
-    @property
+    @cached_property
     def user_agent(self) -> str:
         """Get user agent from browser config."""
         browser_config = self.get_browser_config()
         return browser_config.get("user_agent", DEFAULT_USER_AGENT)
 
-    @property
+    @cached_property
     def locale(self) -> str:
         """Get locale from browser config."""
         browser_config = self.get_browser_config()
         return browser_config.get("locale", DEFAULT_LOCALE)
 
-    @property
+    @cached_property
     def timezone(self) -> str:
         """Get timezone from browser config."""
         browser_config = self.get_browser_config()
         return browser_config.get("timezone", DEFAULT_TIMEZONE)
 
-    @property
+    @cached_property
     def geolocation(self) -> dict[str, float]:
         """Get geolocation from browser config."""
         browser_config = self.get_browser_config()
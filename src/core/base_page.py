@@ -5,12 +5,17 @@ This module provides the foundational BasePage class that all page objects
 inherit from, implementing common page operations and patterns.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
-from src.config.constants import DEFAULT_ACTION_TIMEOUT, DEFAULT_TIMEOUT
+from src.config.constants import (
+    DEFAULT_ACTION_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    SCREENSHOT_FULL_PAGE,
+)
 from src.exceptions import ElementNotFoundException, TimeoutException
 from src.utils.helpers import (
     human_type,
@@ -18,9 +23,11 @@ from src.utils.helpers import (
     random_mouse_move,
     random_scroll,
     safe_click,
+    track_click,
+    wait_for_click_target,
 )
 from src.utils.logger import get_logger
-from src.utils.screenshot_manager import get_screenshot_manager
+from src.utils.screenshot_manager import ScreenshotManager, get_screenshot_manager
 
 logger = get_logger(__name__)
 
@@ -38,17 +45,25 @@ class BasePage(ABC):
         screenshot_manager: Screenshot manager for capturing page states.
     """
 
-    def __init__(self, page: Page, selectors: dict[str, str]):
+    def __init__(
+        self,
+        page: Page,
+        selectors: dict[str, str],
+        screenshot_manager: Optional[ScreenshotManager] = None,
+    ):
         """
         Initialize BasePage.
 
         Args:
             page: Playwright page instance.
             selectors: Dictionary mapping logical names to CSS selectors.
+            screenshot_manager: Screenshot manager to use instead of the
+                shared one.
         """
         self.page = page
-        self.selectors = selectors
-        self.screenshot_manager = get_screenshot_manager()
+        # Own flat copy so lookups never reach back into the settings cache
+        self.selectors = dict(selectors)
+        self.screenshot_manager = screenshot_manager or get_screenshot_manager()
         logger.debug(f"{self.__class__.__name__} initialized")
 
     @abstractmethod
@@ -74,12 +89,18 @@ class BasePage(ABC):
         """
         pass
 
-    async def navigate(self, url: Optional[str] = None) -> None:
+    async def navigate(
+        self,
+        url: Optional[str] = None,
+        wait_until: str = "networkidle",
+    ) -> None:
         """
         Navigate to the page URL.
 
         Args:
             url: Optional URL to navigate to. If not provided, uses get_url().
+            wait_until: Load state to wait for ('load', 'domcontentloaded',
+                'networkidle', 'commit').
 
         Raises:
             TimeoutException: If navigation times out.
@@ -88,7 +109,7 @@ class BasePage(ABC):
 
         try:
             logger.info(f"Navigating to: {target_url}")
-            await self.page.goto(target_url, wait_until="networkidle")
+            await self.page.goto(target_url, wait_until=wait_until)
             await random_delay(2000, 4000)
             logger.info(f"Navigation complete: {self.page.url}")
 
@@ -153,13 +174,21 @@ class BasePage(ABC):
         try:
             logger.debug(f"Clicking element: {selector}")
 
+            element = self.page.locator(selector)
+
             if human_like:
-                await random_delay(500, 1500)
+                # The wait (and measurement) overlaps with the human delay
+                box, _ = await asyncio.gather(
+                    wait_for_click_target(element, timeout),
+                    random_delay(500, 1500),
+                )
                 await random_mouse_move(self.page)
+            else:
+                await element.wait_for(state="visible", timeout=timeout)
+                box = None
 
-            element = self.page.locator(selector)
-            await element.wait_for(state="visible", timeout=timeout)
             await element.click()
+            track_click(self.page, box)
 
             if human_like:
                 await random_delay(1000, 2000)
@@ -179,6 +208,8 @@ class BasePage(ABC):
         text: str,
         human_like: bool = True,
         clear_first: bool = True,
+        pre_delay: Optional[tuple[int, int]] = None,
+        post_delay: Optional[tuple[int, int]] = None,
     ) -> None:
         """
         Type text into an element.
@@ -188,6 +219,8 @@ class BasePage(ABC):
             text: Text to type.
             human_like: Whether to simulate human-like typing.
             clear_first: Whether to clear existing text first.
+            pre_delay: Optional (min, max) pause in milliseconds before typing.
+            post_delay: Optional (min, max) pause in milliseconds after typing.
 
         Raises:
             ElementNotFoundException: If element not found.
@@ -202,12 +235,18 @@ class BasePage(ABC):
             if clear_first:
                 await element.fill("")
 
+            if pre_delay:
+                await random_delay(*pre_delay)
+
             # Type with human-like delays if requested
             if human_like:
                 await human_type(self.page, selector, text)
             else:
                 await element.type(text)
 
+            if post_delay:
+                await random_delay(*post_delay)
+
             logger.debug(f"Text entered into: {selector}")
 
         except PlaywrightTimeoutError as e:
@@ -343,7 +382,8 @@ class BasePage(ABC):
     async def take_screenshot(
         self,
         name: str,
-        full_page: bool = True,
+        full_page: bool = SCREENSHOT_FULL_PAGE,
+        force: bool = False,
     ) -> Optional[Any]:
         """
         Capture a screenshot of the page.
@@ -351,12 +391,13 @@ class BasePage(ABC):
         Args:
             name: Descriptive name for the screenshot.
             full_page: Whether to capture full page or just viewport.
+            force: Capture even if screenshot sampling would skip it.
 
         Returns:
             Path to the screenshot file.
         """
         return await self.screenshot_manager.capture(
-            self.page, name, full_page=full_page
+            self.page, name, full_page=full_page, force=force
         )
 
     async def scroll_randomly(
@@ -417,6 +458,9 @@ class BasePage(ABC):
         Raises:
             KeyError: If selector name not found.
         """
-        if name not in self.selectors:
-            raise KeyError(f"Selector '{name}' not found in {self.__class__.__name__}")
-        return self.selectors[name]
+        try:
+            return self.selectors[name]
+        except KeyError:
+            raise KeyError(
+                f"Selector '{name}' not found in {self.__class__.__name__}"
+            ) from None
@@ -5,17 +5,24 @@ This module provides a centralized browser management system with
 comprehensive stealth configurations to avoid detection.
 """
 
-from typing import Optional
+import re
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
 
 from playwright.async_api import (
     Browser,
     BrowserContext,
     Page,
     Playwright,
+    Request,
+    Route,
     async_playwright,
 )
 
 from src.config.constants import (
+    BLOCKED_RESOURCE_TYPES,
+    BLOCKED_RESOURCE_URL_PATTERN,
     DEFAULT_BROWSER_ARGS,
     DEFAULT_GEOLOCATION,
     DEFAULT_LOCALE,
@@ -24,13 +31,70 @@ from src.config.constants import (
     DEFAULT_VIEWPORT_HEIGHT,
     DEFAULT_VIEWPORT_WIDTH,
     NON_HEADLESS_ARGS,
+    RESOURCE_BLOCK_EXEMPT_PATTERN,
 )
 from src.config.settings import Settings, get_settings
 from src.exceptions import BrowserInitializationException
+from src.utils.helpers import set_fast_mode
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_BLOCKED_RESOURCE_RE = re.compile(BLOCKED_RESOURCE_URL_PATTERN, re.IGNORECASE)
+_BLOCK_EXEMPT_RE = re.compile(RESOURCE_BLOCK_EXEMPT_PATTERN, re.IGNORECASE)
+
+# Scripts that hide automation indicators, combined so they are registered
+# and compiled once per context
+_STEALTH_JS = """
+// Each override is isolated so one failing (e.g. a missing API) doesn't
+// stop the rest from running
+
+// Override navigator.webdriver
+try {
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+} catch (e) {}
+
+// Mock plugins
+try {
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+} catch (e) {}
+
+// Mock languages
+try {
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+} catch (e) {}
+
+// Chrome runtime
+try {
+    window.chrome = {
+        runtime: {}
+    };
+} catch (e) {}
+
+// Mock permissions
+try {
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+} catch (e) {}
+
+// Override platform
+try {
+    Object.defineProperty(navigator, 'platform', {
+        get: () => 'Win32'
+    });
+} catch (e) {}
+"""
+
 
 class BrowserManager:
     """
@@ -66,6 +130,9 @@ class BrowserManager:
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
+        self._context_options: dict[str, Any] = {}
+        self._blocking_enabled = False
+        self._tracing = False
         self._settings: Settings = get_settings()
 
         BrowserManager._initialized = True
@@ -89,147 +156,289 @@ class BrowserManager:
         slow_mo: Optional[int] = None,
         viewport: Optional[dict[str, int]] = None,
         user_agent: Optional[str] = None,
+        storage_state: Optional[Path] = None,
     ) -> None:
         """
         Initialize the browser with anti-detection configurations.
 
+        If the browser is still running from an earlier session (see
+        close_context()), only a fresh context and page are created and the
+        launch options are ignored.
+
         Args:
             headless: Run browser in headless mode (overrides settings).
             slow_mo: Slow motion delay in milliseconds (overrides settings).
             viewport: Custom viewport size (overrides settings).
             user_agent: Custom user agent (overrides settings).
+            storage_state: Saved storage state (cookies, localStorage) to
+                start the context with.
 
         Raises:
             BrowserInitializationException: If browser initialization fails.
         """
-        if self._browser is not None:
+        if self._context is not None:
             logger.warning("Browser already initialized")
             return
 
         try:
-            logger.info("Initializing browser with anti-detection features...")
-
-            # Use provided values or fall back to settings
-            headless_mode = (
-                headless if headless is not None else self._settings.headless
-            )
-            slow_motion = (
-                slow_mo if slow_mo is not None else self._settings.slow_mo
-            )
-
-            # Start Playwright
-            self._playwright = await async_playwright().start()
+            if self._browser is not None:
+                await self._open_default_context(storage_state)
+                logger.info("Reusing running browser with a new context")
+                return
 
-            # Prepare browser arguments
-            browser_args = DEFAULT_BROWSER_ARGS.copy()
+            logger.info("Initializing browser with anti-detection features...")
+            await self._launch_browser(headless, slow_mo, viewport, user_agent)
+            await self._open_default_context(storage_state)
 
-            # Add non-headless specific args
-            if not headless_mode:
-                browser_args.extend(NON_HEADLESS_ARGS)
+            logger.info("Browser initialization complete")
 
-            # Launch browser
-            self._browser = await self._playwright.chromium.launch(
-                headless=headless_mode,
-                args=browser_args,
-                slow_mo=slow_motion,
-            )
+        except Exception as e:
+            logger.error(f"Failed to initialize browser: {e}")
+            await self.close()
+            raise BrowserInitializationException(
+                message=f"Browser initialization failed: {e}",
+                error_type=type(e).__name__,
+            ) from e
 
-            logger.info(f"Browser launched (headless={headless_mode})")
-
-            # Prepare context options
-            viewport_size = viewport or self._settings.viewport_size
-            ua = user_agent or self._settings.user_agent
-
-            # Create context with realistic settings
-            self._context = await self._browser.new_context(
-                viewport=viewport_size if headless_mode else None,
-                user_agent=ua,
-                locale=self._settings.locale,
-                timezone_id=self._settings.timezone,
-                permissions=["geolocation"],
-                geolocation=self._settings.geolocation,
-                color_scheme="light",
-                device_scale_factor=1,
-                has_touch=False,
-                is_mobile=False,
-                java_script_enabled=True,
-            )
+    async def launch(
+        self,
+        headless: Optional[bool] = None,
+        slow_mo: Optional[int] = None,
+        viewport: Optional[dict[str, int]] = None,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        """
+        Launch the browser without opening the manager's own context.
 
-            logger.info("Browser context created with anti-detection settings")
+        For callers that only create their own contexts via create_context().
+        Does nothing if the browser is already running.
 
-            # Create initial page
-            self._page = await self._context.new_page()
+        Args:
+            headless: Run browser in headless mode (overrides settings).
+            slow_mo: Slow motion delay in milliseconds (overrides settings).
+            viewport: Custom viewport size (overrides settings).
+            user_agent: Custom user agent (overrides settings).
 
-            # Inject stealth scripts
-            await self._inject_stealth_scripts()
+        Raises:
+            BrowserInitializationException: If the browser fails to launch.
+        """
+        if self._browser is not None:
+            logger.debug("Browser already running")
+            return
 
-            logger.info("Browser initialization complete")
+        try:
+            logger.info("Launching browser with anti-detection features...")
+            await self._launch_browser(headless, slow_mo, viewport, user_agent)
 
         except Exception as e:
-            logger.error(f"Failed to initialize browser: {e}")
+            logger.error(f"Failed to launch browser: {e}")
             await self.close()
             raise BrowserInitializationException(
-                message=f"Browser initialization failed: {e}",
+                message=f"Browser launch failed: {e}",
                 error_type=type(e).__name__,
             ) from e
 
-    async def _inject_stealth_scripts(self) -> None:
+    async def _launch_browser(
+        self,
+        headless: Optional[bool],
+        slow_mo: Optional[int],
+        viewport: Optional[dict[str, int]],
+        user_agent: Optional[str],
+    ) -> None:
         """
-        Inject JavaScript to hide automation indicators.
+        Start Playwright, launch Chromium and prepare shared context options.
 
-        This method adds various scripts to make the browser appear more
-        like a real user's browser and less like an automated one.
+        Args:
+            headless: Run browser in headless mode (overrides settings).
+            slow_mo: Slow motion delay in milliseconds (overrides settings).
+            viewport: Custom viewport size (overrides settings).
+            user_agent: Custom user agent (overrides settings).
         """
-        if not self._page:
-            return
+        # Use provided values or fall back to settings
+        headless_mode = (
+            headless if headless is not None else self._settings.headless
+        )
+        slow_motion = (
+            slow_mo if slow_mo is not None else self._settings.slow_mo
+        )
+
+        # Start Playwright
+        self._playwright = await async_playwright().start()
+
+        # Prepare browser arguments
+        browser_args = DEFAULT_BROWSER_ARGS.copy()
+
+        # Add non-headless specific args
+        if not headless_mode:
+            browser_args.extend(NON_HEADLESS_ARGS)
+
+        # Launch browser
+        self._browser = await self._playwright.chromium.launch(
+            headless=headless_mode,
+            args=browser_args,
+            slow_mo=slow_motion,
+        )
+
+        logger.info(f"Browser launched (headless={headless_mode})")
+
+        # Nobody watches a headless browser; skip cosmetic behavior
+        set_fast_mode(headless_mode and self._settings.headless_fast)
+
+        # Headed runs may need a human to solve a challenge, so they
+        # always load images
+        self._blocking_enabled = headless_mode and self._settings.block_resources
+
+        # Prepare context options
+        viewport_size = viewport or self._settings.viewport_size
+        ua = user_agent or self._settings.user_agent
+
+        # Realistic settings shared by every context on this browser
+        self._context_options = {
+            "viewport": viewport_size if headless_mode else None,
+            "user_agent": ua,
+            "locale": self._settings.locale,
+            "timezone_id": self._settings.timezone,
+            "permissions": ["geolocation"],
+            "geolocation": self._settings.geolocation,
+            "color_scheme": "light",
+            "device_scale_factor": 1,
+            "has_touch": False,
+            "is_mobile": False,
+            "java_script_enabled": True,
+        }
+
+    async def _open_default_context(
+        self,
+        storage_state: Optional[Path] = None,
+    ) -> None:
+        """
+        Open the manager's own context and its initial page.
 
-        logger.debug("Injecting stealth scripts...")
+        Args:
+            storage_state: Saved storage state to start the context with.
+        """
+        self._context = await self._new_context(storage_state)
+
+        # Record the whole session for post-mortem debugging; the trace is
+        # only written to disk if stop_tracing() is given a path
+        if self._settings.trace:
+            await self._context.tracing.start(
+                screenshots=True,
+                snapshots=True,
+                sources=False,
+            )
+            self._tracing = True
+            logger.debug("Tracing started")
+
+        # Create initial page
+        self._page = await self._context.new_page()
+
+    async def _new_context(
+        self,
+        storage_state: Optional[Path] = None,
+    ) -> BrowserContext:
+        """
+        Create a browser context with anti-detection settings.
+
+        Args:
+            storage_state: Saved storage state to start the context with.
+
+        Returns:
+            Configured browser context.
+        """
+        context = await self._browser.new_context(
+            **self._context_options,
+            storage_state=str(storage_state) if storage_state else None,
+        )
+
+        logger.info("Browser context created with anti-detection settings")
+
+        # Inject stealth scripts (inherited by every page in the context)
+        await self._inject_stealth_scripts(context)
 
-        # Override navigator.webdriver
-        await self._page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
-
-        # Mock plugins
-        await self._page.add_init_script("""
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-        """)
-
-        # Mock languages
-        await self._page.add_init_script("""
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-        """)
-
-        # Chrome runtime
-        await self._page.add_init_script("""
-            window.chrome = {
-                runtime: {}
-            };
-        """)
-
-        # Mock permissions
-        await self._page.add_init_script("""
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-        """)
-
-        # Override platform if needed
-        await self._page.add_init_script("""
-            Object.defineProperty(navigator, 'platform', {
-                get: () => 'Win32'
-            });
-        """)
+        # Skip downloading resources the bot never inspects; only matching
+        # URLs pay for the round-trip through the route handler
+        if self._blocking_enabled:
+            await context.route(_BLOCKED_RESOURCE_RE, self._block_resources)
+            logger.debug(f"Blocking resource types: {sorted(BLOCKED_RESOURCE_TYPES)}")
 
+        return context
+
+    async def create_context(
+        self,
+        storage_state: Optional[Path] = None,
+    ) -> BrowserContext:
+        """
+        Create an additional isolated context on the shared browser.
+
+        The caller owns the returned context and is responsible for closing it.
+
+        Args:
+            storage_state: Saved storage state to start the context with.
+
+        Returns:
+            New browser context.
+
+        Raises:
+            BrowserInitializationException: If browser not initialized.
+        """
+        if not self._browser:
+            raise BrowserInitializationException(
+                "Browser not initialized. Call initialize() first."
+            )
+        return await self._new_context(storage_state)
+
+    @staticmethod
+    async def _block_resources(route: Route) -> None:
+        """
+        Abort requests for non-essential resource types.
+
+        Security challenge resources and anything loaded by a checkpoint page
+        are let through.
+
+        Args:
+            route: Intercepted Playwright route.
+        """
+        request = route.request
+        if (
+            request.resource_type in BLOCKED_RESOURCE_TYPES
+            and not _BLOCK_EXEMPT_RE.search(request.url)
+            and not BrowserManager._from_challenge_frame(request)
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @staticmethod
+    def _from_challenge_frame(request: Request) -> bool:
+        """
+        Check whether a request was made by a security challenge page.
+
+        Args:
+            request: Intercepted request.
+
+        Returns:
+            True if the request's frame is a checkpoint or CAPTCHA page.
+        """
+        try:
+            return bool(_BLOCK_EXEMPT_RE.search(request.frame.url))
+        except Exception:
+            # Service worker requests have no frame
+            return False
+
+    @staticmethod
+    async def _inject_stealth_scripts(context: BrowserContext) -> None:
+        """
+        Inject JavaScript to hide automation indicators.
+
+        The scripts are registered once on the context, so every page it
+        creates (including later ones) runs them before any page script.
+
+        Args:
+            context: Browser context to inject into.
+        """
+        logger.debug("Injecting stealth scripts...")
+        await context.add_init_script(_STEALTH_JS)
         logger.debug("Stealth scripts injected successfully")
 
     async def get_page(self) -> Page:
@@ -264,7 +473,6 @@ class BrowserManager:
             )
 
         new_page = await self._context.new_page()
-        await self._inject_stealth_scripts()
 
         logger.info("New page created")
         return new_page
@@ -286,6 +494,76 @@ class BrowserManager:
             if page_to_close == self._page:
                 self._page = None
 
+    async def stop_tracing(self, path: Optional[Path] = None) -> None:
+        """
+        Stop tracing on the current context.
+
+        Args:
+            path: Where to save the trace archive. If None, the recorded
+                trace is discarded.
+        """
+        if not self._context or not self._tracing:
+            return
+
+        self._tracing = False
+        try:
+            if path:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                await self._context.tracing.stop(path=str(path))
+                logger.info(f"Trace saved: {path}")
+            else:
+                await self._context.tracing.stop()
+                logger.debug("Trace discarded")
+
+        except Exception as e:
+            logger.warning(f"Failed to stop tracing: {e}")
+
+    @asynccontextmanager
+    async def tracing_paused(self, page: Page) -> AsyncIterator[None]:
+        """
+        Keep actions on a page out of the trace, e.g. while typing secrets.
+
+        Trace action parameters include typed text and evaluate() arguments.
+        Playwright can't pause a recording, so the current chunk (everything
+        recorded so far) is discarded and a new chunk starts afterwards.
+        Does nothing if the page's context is not being traced.
+
+        Args:
+            page: Page the hidden actions run on.
+        """
+        if not self._tracing or page.context is not self._context:
+            yield
+            return
+
+        await self._context.tracing.stop_chunk()
+        logger.debug("Tracing paused")
+        try:
+            yield
+        finally:
+            if self._tracing:
+                await self._context.tracing.start_chunk()
+                logger.debug("Tracing resumed")
+
+    async def close_context(self) -> None:
+        """
+        Close the current context and page but keep the browser running.
+
+        A later initialize() call reuses the running browser, skipping the
+        Playwright and Chromium startup cost.
+        """
+        try:
+            if self._context:
+                await self._context.close()
+                self._context = None
+                self._tracing = False
+
+            self._page = None
+
+            logger.info("Browser context closed (browser kept running)")
+
+        except Exception as e:
+            logger.error(f"Error closing browser context: {e}")
+
     async def close(self) -> None:
         """Close all browser resources."""
         logger.info("Closing browser...")
@@ -294,6 +572,7 @@ class BrowserManager:
             if self._context:
                 await self._context.close()
                 self._context = None
+                self._tracing = False
 
             if self._browser:
                 await self._browser.close()
@@ -9,6 +9,7 @@ from playwright.async_api import Page
 from src.config.constants import LINKEDIN_FEED_URL, URL_PATTERN_FEED
 from src.config.settings import get_settings
 from src.core.base_page import BasePage
+from src.utils.helpers import wait_for_network_idle
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -31,6 +32,7 @@ class FeedPage(BasePage):
         settings = get_settings()
         selectors = settings.get_selectors("feed_page")
         super().__init__(page, selectors)
+        self._posts_locator = self.page.locator(self.get_selector("post_item"))
 
     def get_url(self) -> str:
         """
@@ -94,9 +96,7 @@ class FeedPage(BasePage):
             Number of visible feed posts.
         """
         try:
-            # This is a placeholder - actual selector would depend on LinkedIn's structure
-            posts_selector = '[data-id*="urn:li:activity"]'
-            count = await self.page.locator(posts_selector).count()
+            count = await self._posts_locator.count()
             logger.debug(f"Found {count} feed posts")
             return count
 
@@ -121,6 +121,9 @@ class FeedPage(BasePage):
         """Perform human-like interactions on the feed page."""
         logger.info("Performing human-like interactions on feed")
 
+        # Let the feed mount its posts so the scrolls below actually load content
+        await wait_for_network_idle(self.page, timeout=3000)
+
         # Random mouse movements
         await self.random_mouse_move()
 
@@ -195,10 +195,8 @@ class SalesNavigatorPage(BasePage):
 
             if health["accessible"]:
                 logger.info("Sales Navigator is accessible")
-                await self.take_screenshot("sales_nav_health_check")
             else:
                 logger.warning("Sales Navigator access verification failed")
-                await self.take_screenshot("sales_nav_access_failed")
 
         except Exception as e:
             logger.error(f"Health check failed: {e}")
@@ -3,7 +3,10 @@
 from src.utils.helpers import (
     random_delay,
     human_type,
+    split_typing_chunks,
     random_mouse_move,
+    wait_for_click_target,
+    track_click,
     random_scroll,
     smooth_scroll_to_element,
     random_page_interaction,
@@ -13,6 +16,7 @@ from src.utils.helpers import (
     generate_random_user_agent,
     wait_for_network_idle,
     safe_click,
+    set_fast_mode,
 )
 from src.utils.logger import get_logger, set_log_level, set_all_log_levels
 from src.utils.screenshot_manager import ScreenshotManager, get_screenshot_manager
@@ -21,7 +25,10 @@ __all__ = [
     # Helpers
     "random_delay",
     "human_type",
+    "split_typing_chunks",
     "random_mouse_move",
+    "wait_for_click_target",
+    "track_click",
     "random_scroll",
     "smooth_scroll_to_element",
     "random_page_interaction",
@@ -31,6 +38,7 @@ __all__ = [
     "generate_random_user_agent",
     "wait_for_network_idle",
     "safe_click",
+    "set_fast_mode",
     # Logger
     "get_logger",
     "set_log_level",
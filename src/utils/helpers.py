@@ -6,19 +6,23 @@ such as random delays, typing, mouse movements, and scrolling.
 """
 
 import asyncio
+import logging
 import random
 from functools import wraps
-from time import time
-from typing import Any, Callable, Coroutine, TypeVar
+from time import perf_counter_ns
+from typing import Any, Callable, Coroutine, Optional, TypeVar
 
-from playwright.async_api import Page
+from playwright.async_api import Locator, Page
 
 from src.config.constants import (
+    FAST_MODE_MAX_DELAY,
     MAX_ACTION_DELAY,
+    MAX_MOUSE_STEP_DELAY,
     MAX_MOUSE_STEPS,
     MAX_SCROLL_DELAY,
     MAX_TYPING_DELAY,
     MIN_ACTION_DELAY,
+    MIN_MOUSE_STEP_DELAY,
     MIN_MOUSE_STEPS,
     MIN_SCROLL_DELAY,
     MIN_TYPING_DELAY,
@@ -29,6 +33,67 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Private generator, so other code seeding or drawing from the global
+# random module doesn't affect (or get affected by) human-like timings
+_rng = random.Random()
+
+# How long safe_click lets the page settle after a click, in milliseconds
+_CLICK_SETTLE_TIMEOUT = 1500
+
+# Locators reused across helper calls, keyed by id(page) then selector
+_locator_cache: dict[int, dict[str, Locator]] = {}
+
+# Last known mouse position per page, keyed by id(page); Playwright's mouse
+# starts at the top-left corner
+_mouse_positions: dict[int, tuple[float, float]] = {}
+
+# How long to wait for a click target's bounding box, in milliseconds
+_BOUNDING_BOX_TIMEOUT = 1000
+
+# When enabled (headless runs), purely cosmetic behavior is skipped and
+# delays are capped, since there is no visual observer to fool
+_fast_mode = False
+
+
+def set_fast_mode(enabled: bool) -> None:
+    """
+    Enable or disable fast mode for human-like behavior helpers.
+
+    In fast mode, random mouse movements are skipped and random delays are
+    capped at FAST_MODE_MAX_DELAY milliseconds.
+
+    Args:
+        enabled: Whether fast mode is enabled.
+    """
+    global _fast_mode
+    _fast_mode = enabled
+    logger.debug(f"Fast mode {'enabled' if enabled else 'disabled'}")
+
+
+def _locator(page: Page, selector: str) -> Locator:
+    """
+    Get a cached locator for a selector on a page.
+
+    Entries for a page are dropped when the page closes.
+
+    Args:
+        page: Playwright page instance.
+        selector: Element selector.
+
+    Returns:
+        Locator for the selector.
+    """
+    page_id = id(page)
+    page_locators = _locator_cache.get(page_id)
+    if page_locators is None:
+        page_locators = _locator_cache[page_id] = {}
+        page.once("close", lambda _: _locator_cache.pop(page_id, None))
+
+    locator = page_locators.get(selector)
+    if locator is None:
+        locator = page_locators[selector] = page.locator(selector)
+    return locator
+
 
 async def random_delay(
     min_ms: int = MIN_ACTION_DELAY,
@@ -41,8 +106,12 @@ async def random_delay(
         min_ms: Minimum delay in milliseconds.
         max_ms: Maximum delay in milliseconds.
     """
-    delay_ms = random.randint(min_ms, max_ms)
-    delay_sec = delay_ms / 1000.0
+    if _fast_mode:
+        max_ms = min(max_ms, FAST_MODE_MAX_DELAY)
+        min_ms = min(min_ms, max_ms)
+
+    # uniform() is a single C-level call, unlike randint()'s rejection sampling
+    delay_sec = _rng.uniform(min_ms, max_ms) / 1000.0
     logger.debug(f"Random delay: {delay_sec:.2f}s")
     await asyncio.sleep(delay_sec)
 
@@ -66,11 +135,105 @@ async def human_type(
     """
     logger.debug(f"Typing into {selector} with human-like delays")
 
-    element = page.locator(selector)
+    if not text:
+        return
+
+    # Sample every keystroke delay in one call
+    delays = _rng.choices(range(min_delay, max_delay + 1), k=len(text))
+
+    # Resolve the element once; the chunks then go straight to the focused
+    # element through the keyboard, without re-running actionability checks
+    await _locator(page, selector).focus()
+
+    # One driver call per chunk; the pause between chunks reuses a sampled delay
+    bounds = split_typing_chunks(len(text))
+    for start, end in zip(bounds, bounds[1:]):
+        chunk_delay = sum(delays[start:end]) // (end - start)
+        await page.keyboard.type(text[start:end], delay=chunk_delay)
+        if end < len(text):
+            await asyncio.sleep(delays[end] / 1000.0)
+
+
+def split_typing_chunks(
+    length: int,
+    min_chunks: int = 3,
+    max_chunks: int = 5,
+) -> list[int]:
+    """
+    Pick random boundaries for splitting typed text into chunks.
+
+    Args:
+        length: Length of the text to split.
+        min_chunks: Minimum number of chunks.
+        max_chunks: Maximum number of chunks.
+
+    Returns:
+        Sorted boundary offsets, starting with 0 and ending with ``length``.
+    """
+    if length <= 0:
+        return [0]
+
+    num_chunks = min(length, _rng.randint(min_chunks, max_chunks))
+    cuts = sorted(_rng.sample(range(1, length), num_chunks - 1))
+    return [0, *cuts, length]
 
-    for char in text:
-        delay = random.randint(min_delay, max_delay)
-        await element.type(char, delay=delay)
+
+def _set_mouse_position(page: Page, position: tuple[float, float]) -> None:
+    """Remember where the cursor is on page, forgetting it when page closes."""
+    page_id = id(page)
+    if page_id not in _mouse_positions:
+        page.once("close", lambda _: _mouse_positions.pop(page_id, None))
+    _mouse_positions[page_id] = position
+
+
+async def wait_for_click_target(
+    element: Locator,
+    timeout: int,
+) -> Optional[dict[str, float]]:
+    """
+    Wait for an element to be visible and measure it for track_click().
+
+    Meant to run alongside a human delay before the click, so the extra
+    measurement adds no latency. Skipped in fast mode, where the mouse
+    position is never used.
+
+    Args:
+        element: Locator of the element to click.
+        timeout: Timeout in milliseconds.
+
+    Returns:
+        The element's bounding box, or None if not measured.
+
+    Raises:
+        PlaywrightTimeoutError: If the element does not become visible.
+    """
+    await element.wait_for(state="visible", timeout=timeout)
+    if _fast_mode:
+        return None
+
+    try:
+        return await element.bounding_box(timeout=_BOUNDING_BOX_TIMEOUT)
+    except Exception as e:
+        logger.debug(f"Could not measure click target: {e}")
+        return None
+
+
+def track_click(page: Page, box: Optional[dict[str, float]]) -> None:
+    """
+    Record that a click left the cursor at the center of box.
+
+    Playwright moves the mouse to the element's center to click it, so the
+    next random_mouse_move must start from there rather than from wherever
+    the previous movement left off.
+
+    Args:
+        page: Playwright page instance.
+        box: Bounding box from wait_for_click_target(), or None.
+    """
+    if box:
+        _set_mouse_position(
+            page, (box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
+        )
 
 
 async def random_mouse_move(
@@ -81,11 +244,17 @@ async def random_mouse_move(
     """
     Perform random mouse movements to simulate human behavior.
 
+    The cursor follows a cubic ease-in-out path from its last position, with
+    a short random pause at each waypoint.
+
     Args:
         page: Playwright page instance.
         min_steps: Minimum number of movement steps.
         max_steps: Maximum number of movement steps.
     """
+    if _fast_mode:
+        return
+
     try:
         viewport = page.viewport_size
         if not viewport:
@@ -93,13 +262,25 @@ async def random_mouse_move(
             return
 
         # Generate random target position (avoid edges)
-        x = random.randint(100, viewport["width"] - 100)
-        y = random.randint(100, viewport["height"] - 100)
+        x = _rng.randint(100, viewport["width"] - 100)
+        y = _rng.randint(100, viewport["height"] - 100)
 
         # Move with random number of steps for natural curve
-        steps = random.randint(min_steps, max_steps)
+        steps = _rng.randint(min_steps, max_steps)
+
+        x0, y0 = _mouse_positions.get(id(page), (0.0, 0.0))
+
+        for i in range(1, steps + 1):
+            t = i / steps
+            eased = 3 * t * t - 2 * t * t * t
+            position = (x0 + (x - x0) * eased, y0 + (y - y0) * eased)
+            await page.mouse.move(*position)
+            _set_mouse_position(page, position)
+            if i < steps:
+                await asyncio.sleep(
+                    _rng.uniform(MIN_MOUSE_STEP_DELAY, MAX_MOUSE_STEP_DELAY) / 1000.0
+                )
 
-        await page.mouse.move(x, y, steps=steps)
         logger.debug(f"Mouse moved to ({x}, {y}) in {steps} steps")
 
     except Exception as e:
@@ -122,7 +303,7 @@ async def random_scroll(
         direction: Scroll direction ('down' or 'up').
     """
     try:
-        scroll_amount = random.randint(min_amount, max_amount)
+        scroll_amount = _rng.randint(min_amount, max_amount)
 
         # Negative for up, positive for down
         scroll_value = scroll_amount if direction == "down" else -scroll_amount
@@ -151,7 +332,7 @@ async def smooth_scroll_to_element(
         offset: Offset from the element in pixels (default centers it).
     """
     try:
-        element = page.locator(selector).first
+        element = _locator(page, selector).first
 
         # Scroll element into view with smooth behavior
         await element.evaluate(
@@ -169,19 +350,25 @@ async def smooth_scroll_to_element(
         logger.debug(f"Smooth scroll error: {e}")
 
 
-async def random_page_interaction(page: Page) -> None:
+async def random_page_interaction(page: Page, parallel: bool = False) -> None:
     """
     Perform a random page interaction (scroll or mouse move).
 
     Args:
         page: Playwright page instance.
+        parallel: Scroll and move the mouse at the same time instead of
+            picking one, so the interaction takes as long as the slower one.
     """
+    if parallel:
+        await asyncio.gather(random_mouse_move(page), random_scroll(page))
+        return
+
     actions = [
         lambda: random_mouse_move(page),
         lambda: random_scroll(page),
     ]
 
-    action = random.choice(actions)
+    action = _rng.choice(actions)
     await action()
 
 
@@ -190,15 +377,26 @@ def retry_on_exception(
     delay: float = 1.0,
     exceptions: tuple[type[Exception], ...] = (Exception,),
     backoff: float = 2.0,
+    max_delay: float = 60.0,
+    jitter: bool = True,
+    giveup: Optional[Callable[[Exception], bool]] = None,
 ) -> Callable[[Callable[..., Coroutine[Any, Any, T]]], Callable[..., Coroutine[Any, Any, T]]]:
     """
     Decorator to retry an async function on exception.
 
+    The wait before retry n is capped at min(max_delay, delay * backoff**(n-1)).
+    With jitter, the actual wait is drawn uniformly from [0, cap] ("full
+    jitter"), so concurrent callers don't retry in lockstep.
+
     Args:
         max_attempts: Maximum number of retry attempts.
         delay: Initial delay between retries in seconds.
         exceptions: Tuple of exception types to catch.
         backoff: Multiplier for delay between retries.
+        max_delay: Upper bound for a single delay in seconds.
+        jitter: Whether to randomize each delay between 0 and its cap.
+        giveup: Optional predicate; if it returns True for an exception,
+            that exception is re-raised without further retries.
 
     Returns:
         Decorated function with retry logic.
@@ -215,7 +413,6 @@ def retry_on_exception(
     def decorator(func: Callable[..., Coroutine[Any, Any, T]]) -> Callable[..., Coroutine[Any, Any, T]]:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            current_delay = delay
             last_exception = None
 
             for attempt in range(1, max_attempts + 1):
@@ -223,18 +420,24 @@ def retry_on_exception(
                     return await func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
+                    if giveup is not None and giveup(e):
+                        logger.error(f"{func.__name__} failed with non-retryable error: {e}")
+                        raise
+
                     if attempt == max_attempts:
                         logger.error(
                             f"{func.__name__} failed after {max_attempts} attempts"
                         )
                         raise
 
+                    cap = min(max_delay, delay * backoff ** (attempt - 1))
+                    current_delay = _rng.uniform(0, cap) if jitter else cap
+
                     logger.warning(
                         f"{func.__name__} failed (attempt {attempt}/{max_attempts}): {e}. "
                         f"Retrying in {current_delay:.1f}s..."
                     )
                     await asyncio.sleep(current_delay)
-                    current_delay *= backoff
 
             # This should never be reached, but satisfies type checker
             if last_exception:
@@ -270,13 +473,13 @@ def timing_decorator(
     def decorator(func: Callable[..., Coroutine[Any, Any, T]]) -> Callable[..., Coroutine[Any, Any, T]]:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            start_time = time()
+            start_ns = perf_counter_ns()
             try:
                 result = await func(*args, **kwargs)
                 return result
             finally:
-                elapsed = time() - start_time
-                if log_result:
+                if log_result and logger.isEnabledFor(logging.DEBUG):
+                    elapsed = (perf_counter_ns() - start_ns) / 1e9
                     logger.debug(
                         f"{func.__name__} executed in {elapsed:.2f}s"
                     )
@@ -301,7 +504,7 @@ def generate_realistic_viewport() -> dict[str, int]:
         {"width": 2560, "height": 1440},  # QHD
     ]
 
-    return random.choice(common_resolutions)
+    return _rng.choice(common_resolutions)
 
 
 def generate_random_user_agent() -> str:
@@ -312,7 +515,7 @@ def generate_random_user_agent() -> str:
         User agent string.
     """
     chrome_versions = ["130.0.0.0", "131.0.0.0", "132.0.0.0"]
-    chrome_version = random.choice(chrome_versions)
+    chrome_version = _rng.choice(chrome_versions)
 
     return (
         f"Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -325,18 +528,33 @@ async def wait_for_network_idle(
     page: Page,
     timeout: int = 30000,
     idle_time: int = 500,
+    soft_timeout: int = 1500,
 ) -> None:
     """
     Wait for network to be idle (no requests for specified time).
 
+    Pages with analytics beacons or long polling may never go idle, so the
+    idle wait is capped at soft_timeout. After that the page only has to
+    reach domcontentloaded within timeout.
+
     Args:
         page: Playwright page instance.
         timeout: Maximum wait time in milliseconds.
         idle_time: Time in milliseconds to consider network idle.
+        soft_timeout: Maximum time in milliseconds to wait for true idle.
     """
     try:
-        await page.wait_for_load_state("networkidle", timeout=timeout)
+        await page.wait_for_load_state(
+            "networkidle", timeout=min(soft_timeout, timeout)
+        )
         logger.debug("Network is idle")
+        return
+    except Exception as e:
+        logger.debug(f"Network not idle after {soft_timeout}ms: {e}")
+
+    try:
+        await page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        logger.debug("Fell back to domcontentloaded")
     except Exception as e:
         logger.debug(f"Network idle wait failed: {e}")
 
@@ -347,34 +565,53 @@ async def safe_click(
     timeout: int = 30000,
     delay_before: tuple[int, int] = (500, 1500),
     delay_after: tuple[int, int] = (1000, 2000),
+    settle: bool = False,
 ) -> bool:
     """
     Safely click an element with delays and error handling.
 
+    The pause before the click runs while waiting for the element, so it
+    adds no latency on top of that wait.
+
     Args:
         page: Playwright page instance.
         selector: Element selector.
         timeout: Timeout in milliseconds.
         delay_before: (min, max) delay before click in milliseconds.
         delay_after: (min, max) delay after click in milliseconds.
+        settle: Also wait (up to _CLICK_SETTLE_TIMEOUT) for the network to
+            go idle after the click, overlapping with the delay after it.
+            Off by default because pages with background traffic never go
+            idle, which makes every click take the full timeout.
 
     Returns:
         True if click successful, False otherwise.
     """
     try:
-        # Wait for element
-        element = page.locator(selector)
-        await element.wait_for(state="visible", timeout=timeout)
-
-        # Human delay before click
-        await random_delay(*delay_before)
+        # Wait for (and measure) element alongside the human delay before click
+        element = _locator(page, selector)
+        box, _ = await asyncio.gather(
+            wait_for_click_target(element, timeout),
+            random_delay(*delay_before),
+        )
 
         # Click
         await element.click()
+        track_click(page, box)
         logger.debug(f"Clicked element: {selector}")
 
-        # Human delay after click
-        await random_delay(*delay_after)
+        # Human delay after click, optionally overlapping with the page settling
+        if settle:
+            await asyncio.gather(
+                random_delay(*delay_after),
+                wait_for_network_idle(
+                    page,
+                    timeout=_CLICK_SETTLE_TIMEOUT,
+                    soft_timeout=_CLICK_SETTLE_TIMEOUT,
+                ),
+            )
+        else:
+            await random_delay(*delay_after)
 
         return True
 
@@ -5,10 +5,12 @@ This module provides a centralized logging setup with console colors,
 file rotation, and customizable formatting.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -39,11 +41,16 @@ class BotLogger:
     """
     Centralized logger for the LinkedIn Bot.
 
-    Provides colored console output and rotating file logs.
+    Provides colored console output and rotating file logs. File writes
+    happen on a background listener thread so logging never blocks the
+    event loop on disk I/O.
     """
 
     _instance: Optional["BotLogger"] = None
     _loggers: dict[str, logging.Logger] = {}
+    _log_queue: Optional[queue.SimpleQueue] = None
+    _queue_listener: Optional[QueueListener] = None
+    _file_logging_enabled: bool = True
 
     def __new__(cls) -> "BotLogger":
         """Ensure singleton pattern."""
@@ -98,7 +105,7 @@ class BotLogger:
             logger.addHandler(console_handler)
 
         # Add file handler
-        if log_to_file:
+        if log_to_file and self._file_logging_enabled:
             file_handler = self._create_file_handler()
             logger.addHandler(file_handler)
 
@@ -131,6 +138,27 @@ class BotLogger:
         return console_handler
 
     def _create_file_handler(self) -> logging.Handler:
+        """
+        Create a queue handler feeding the shared rotating file handler.
+
+        The rotating file handler and its listener thread are created on
+        first use and shared by all loggers.
+
+        Returns:
+            Queue handler for file logging.
+        """
+        cls = type(self)
+        if cls._queue_listener is None:
+            cls._log_queue = queue.SimpleQueue()
+            cls._queue_listener = QueueListener(
+                cls._log_queue,
+                self._create_rotating_file_handler(),
+            )
+            cls._queue_listener.start()
+
+        return QueueHandler(cls._log_queue)
+
+    def _create_rotating_file_handler(self) -> logging.Handler:
         """
         Create a rotating file handler.
 
@@ -145,6 +173,7 @@ class BotLogger:
             maxBytes=LOG_MAX_BYTES,
             backupCount=LOG_BACKUP_COUNT,
             encoding="utf-8",
+            delay=True,  # Only create the file once something is logged
         )
 
         formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
@@ -174,6 +203,16 @@ class BotLogger:
         for logger in self._loggers.values():
             logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
+    @classmethod
+    def disable_file_logging(cls) -> None:
+        """Detach file logging from all loggers and stop creating it."""
+        cls._file_logging_enabled = False
+        for logger in cls._loggers.values():
+            for handler in logger.handlers[:]:
+                if isinstance(handler, QueueHandler):
+                    logger.removeHandler(handler)
+        cls._stop_queue_listener()
+
     @classmethod
     def cleanup(cls) -> None:
         """Close all file handlers and clear cached loggers."""
@@ -182,6 +221,18 @@ class BotLogger:
                 handler.close()
                 logger.removeHandler(handler)
         cls._loggers.clear()
+        cls._stop_queue_listener()
+
+    @classmethod
+    def _stop_queue_listener(cls) -> None:
+        """Stop the file listener thread and close the log file."""
+        # Flush queued records to disk before closing the file
+        if cls._queue_listener is not None:
+            cls._queue_listener.stop()
+            for handler in cls._queue_listener.handlers:
+                handler.close()
+            cls._queue_listener = None
+            cls._log_queue = None
 
 
 # Singleton instance
@@ -246,7 +297,21 @@ def set_all_log_levels(level: str) -> None:
         _bot_logger.set_all_levels(level)
 
 
+def disable_file_logging() -> None:
+    """
+    Stop writing log files, keeping console output.
+
+    Used by the test suite so test runs don't leave log files behind.
+    """
+    BotLogger.disable_file_logging()
+
+
 def cleanup_loggers() -> None:
     """Close all file handlers and clean up resources."""
     if _bot_logger:
         BotLogger.cleanup()
+
+
+# The file listener runs on a daemon thread; drain its queue before exit so
+# the last records (often the final errors) reach the log file
+atexit.register(cleanup_loggers)
@@ -5,9 +5,16 @@ This module provides functionality for capturing, organizing, and managing
 screenshots during bot execution for debugging and monitoring purposes.
 """
 
+import asyncio
+import functools
+import hashlib
+import itertools
+import os
+import string
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from playwright.async_api import Page
 
@@ -21,6 +28,19 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Image type passed to Playwright; quality only applies to JPEG
+_SCREENSHOT_IS_JPEG = SCREENSHOT_FORMAT == "jpg"
+_SCREENSHOT_TYPE = "jpeg" if _SCREENSHOT_IS_JPEG else "png"
+
+# Tolerance for float drift in the sampling accumulator (0.1 * 10 < 1.0)
+_SAMPLE_EPSILON = 1e-9
+
+# Maps every ASCII character outside [A-Za-z0-9_-] to "_" for file names
+_FILENAME_ALLOWED = frozenset(string.ascii_letters + string.digits + "-_")
+_FILENAME_TABLE = str.maketrans(
+    {chr(i): "_" for i in range(128) if chr(i) not in _FILENAME_ALLOWED}
+)
+
 
 class ScreenshotManager:
     """
@@ -29,23 +49,55 @@ class ScreenshotManager:
     Attributes:
         base_dir: Base directory for storing screenshots.
         session_dir: Directory for current session screenshots.
+        sample_prob: Fraction of capture() calls that take a screenshot.
     """
 
-    def __init__(self, base_dir: Path = SCREENSHOTS_DIR):
+    def __init__(
+        self,
+        base_dir: Path = SCREENSHOTS_DIR,
+        sample_prob: float = 1.0,
+    ):
         """
         Initialize ScreenshotManager.
 
         Args:
             base_dir: Base directory for screenshots.
+            sample_prob: Fraction of capture() calls that take a screenshot.
         """
         self.base_dir = base_dir
+        self.sample_prob = 1.0
+        self._accum = 0.0
+        self.set_sample_prob(sample_prob)
         self.session_dir: Optional[Path] = None
+        self._sequence = itertools.count(1)
+        self._pending_writes: set[asyncio.Task] = set()
+        self._last_hash: Optional[bytes] = None
+        self._last_path: Optional[Path] = None
         self._ensure_directories()
 
     def _ensure_directories(self) -> None:
         """Ensure screenshot directories exist."""
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
+    def set_sample_prob(self, sample_prob: float) -> None:
+        """
+        Set the fraction of capture() calls that take a screenshot.
+
+        Sampling is deterministic: with sample_prob=0.25, every fourth call
+        captures.
+
+        Args:
+            sample_prob: Value in (0, 1]; 1.0 captures every call.
+
+        Raises:
+            ValueError: If sample_prob is outside (0, 1].
+        """
+        if not 0.0 < sample_prob <= 1.0:
+            raise ValueError(f"sample_prob must be in (0, 1], got {sample_prob}")
+
+        self.sample_prob = sample_prob
+        self._accum = 0.0
+
     def create_session_directory(self, session_name: Optional[str] = None) -> Path:
         """
         Create a directory for the current session.
@@ -62,6 +114,11 @@ class ScreenshotManager:
 
         self.session_dir = self.base_dir / session_name
         self.session_dir.mkdir(parents=True, exist_ok=True)
+        self._sequence = itertools.count(1)
+
+        # Never dedupe against a file in another session's directory
+        self._last_hash = None
+        self._last_path = None
 
         logger.debug(f"Created session directory: {self.session_dir}")
         return self.session_dir
@@ -69,30 +126,34 @@ class ScreenshotManager:
     def get_screenshot_path(
         self,
         name: str,
-        include_timestamp: bool = True,
+        numbered: bool = True,
         extension: str = SCREENSHOT_FORMAT,
     ) -> Path:
         """
         Generate a path for a screenshot.
 
+        Screenshots go into the session directory, which is created on first
+        use if needed. The session directory name carries the timestamp, so
+        files only need a per-session sequence number to stay unique.
+
         Args:
             name: Descriptive name for the screenshot.
-            include_timestamp: Whether to include timestamp in filename.
+            numbered: Whether to append the session sequence number.
             extension: File extension (default from constants).
 
         Returns:
             Path object for the screenshot file.
         """
-        # Use session directory if available, otherwise base directory
-        target_dir = self.session_dir if self.session_dir else self.base_dir
+        target_dir = self.session_dir or self.create_session_directory()
 
         # Sanitize name (replace spaces and special characters)
-        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        safe_name = name.translate(_FILENAME_TABLE)
+        if not safe_name.isascii():
+            safe_name = "".join(c if c.isascii() else "_" for c in safe_name)
 
-        # Add timestamp if requested
-        if include_timestamp:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{safe_name}_{timestamp}.{extension}"
+        # Add sequence number if requested
+        if numbered:
+            filename = f"{safe_name}_{next(self._sequence):04d}.{extension}"
         else:
             filename = f"{safe_name}.{extension}"
 
@@ -104,36 +165,89 @@ class ScreenshotManager:
         name: str,
         full_page: bool = SCREENSHOT_FULL_PAGE,
         quality: int = SCREENSHOT_QUALITY,
+        force: bool = False,
+        dedupe: bool = True,
     ) -> Optional[Path]:
         """
         Capture a screenshot of the current page.
 
+        Unless force is set, calls are subject to sampling (see
+        set_sample_prob()), and skipped calls return None.
+
+        The image is written to disk in a background thread so the caller can
+        continue with its next action; use flush() to wait for pending writes.
+        If the image is identical to the previous capture, nothing is written
+        and the previous screenshot's path is returned.
+
         Args:
             page: Playwright page instance.
             name: Descriptive name for the screenshot.
             full_page: Whether to capture full page or just viewport.
             quality: JPEG quality (0-100), only for JPEG format.
+            force: Capture regardless of the sampling rate.
+            dedupe: Reuse the previous file if the image is unchanged.
 
         Returns:
-            Path to the saved screenshot, or None if failed.
+            Path to the screenshot (possibly not yet written), or None if
+            failed or skipped by sampling.
         """
+        if not force:
+            self._accum += self.sample_prob
+            if self._accum < 1.0 - _SAMPLE_EPSILON:
+                logger.debug(f"Screenshot '{name}' skipped by sampling")
+                return None
+            self._accum -= 1.0
+
         try:
-            screenshot_path = self.get_screenshot_path(name)
+            options = {"type": _SCREENSHOT_TYPE, "full_page": full_page}
+            if _SCREENSHOT_IS_JPEG:
+                options["quality"] = quality
 
             # Capture screenshot
-            await page.screenshot(
-                path=str(screenshot_path),
-                full_page=full_page,
-                quality=quality if screenshot_path.suffix == ".jpg" else None,
+            data = await page.screenshot(**options)
+
+            # Skip the write when the page has not changed since the last shot
+            digest = hashlib.sha256(data).digest()
+            if dedupe and digest == self._last_hash:
+                logger.debug(
+                    f"Screenshot '{name}' unchanged, reusing {self._last_path.name}"
+                )
+                return self._last_path
+
+            screenshot_path = self.get_screenshot_path(name)
+            self._last_hash = digest
+            self._last_path = screenshot_path
+
+            # Write to disk off the critical path
+            task = asyncio.create_task(
+                asyncio.to_thread(screenshot_path.write_bytes, data)
             )
+            self._pending_writes.add(task)
+            task.add_done_callback(self._on_write_done)
 
-            logger.info(f"Screenshot saved: {screenshot_path.name}")
+            logger.info(f"Screenshot captured: {screenshot_path.name}")
             return screenshot_path
 
         except Exception as e:
             logger.error(f"Failed to capture screenshot '{name}': {e}")
             return None
 
+    def _on_write_done(self, task: asyncio.Task) -> None:
+        """
+        Forget a finished screenshot write and report failures.
+
+        Args:
+            task: Completed write task.
+        """
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Failed to write screenshot: {task.exception()}")
+
+    async def flush(self) -> None:
+        """Wait for all pending screenshot writes to finish."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+
     async def capture_element(
         self,
         page: Page,
@@ -188,7 +302,7 @@ class ScreenshotManager:
         if exception:
             logger.error(f"Capturing error screenshot for: {exception}")
 
-        return await self.capture(page, error_name, full_page=True)
+        return await self.capture(page, error_name, full_page=True, force=True)
 
     async def capture_sequence(
         self,
@@ -197,19 +311,33 @@ class ScreenshotManager:
         count: int,
     ) -> list[Path]:
         """
-        Capture a sequence of screenshots (e.g., for a multi-step process).
+        Capture a sequence of screenshots concurrently.
+
+        The captures are issued together, so their driver round-trips
+        overlap. Playwright accepts concurrent screenshot calls, although the
+        browser renders shots of the same page one after another. Every shot
+        is written, even if the page did not change, and sampling does not
+        apply.
 
         Args:
             page: Playwright page instance.
             base_name: Base name for the screenshot sequence.
-            count: Current step number in the sequence.
+            count: Number of screenshots to capture, named
+                ``{base_name}_01_NNNN`` to ``{base_name}_{count}_NNNN``, where
+                NNNN is the screenshot's number within the session.
 
         Returns:
             List of paths to saved screenshots.
         """
-        name = f"{base_name}_{count:02d}"
-        result = await self.capture(page, name)
-        return [result] if result else []
+        results = await asyncio.gather(
+            *(
+                self.capture(
+                    page, f"{base_name}_{i:02d}", force=True, dedupe=False
+                )
+                for i in range(1, count + 1)
+            )
+        )
+        return [result for result in results if result]
 
     def cleanup_old_screenshots(self, days: int = 7) -> int:
         """
@@ -222,12 +350,12 @@ class ScreenshotManager:
             Number of files deleted.
         """
         try:
-            cutoff_time = datetime.now().timestamp() - (days * 86400)
+            cutoff_time = time.time() - (days * 86400)
             deleted_count = 0
 
-            for screenshot_file in self.base_dir.rglob(f"*.{SCREENSHOT_FORMAT}"):
-                if screenshot_file.stat().st_mtime < cutoff_time:
-                    screenshot_file.unlink()
+            for entry in self._scan_screenshots():
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                    os.unlink(entry.path)
                     deleted_count += 1
 
             if deleted_count > 0:
@@ -261,13 +389,31 @@ class ScreenshotManager:
         Returns:
             Total screenshot count.
         """
-        return len(list(self.base_dir.rglob(f"*.{SCREENSHOT_FORMAT}")))
+        return sum(1 for _ in self._scan_screenshots())
 
+    def _scan_screenshots(self) -> Iterator[os.DirEntry]:
+        """
+        Walk the screenshot tree and yield screenshot file entries.
+
+        Uses os.scandir so file type checks and stat() reuse the data
+        already read from the directory listing.
+
+        Yields:
+            Directory entries for screenshot files under base_dir.
+        """
+        suffix = f".{SCREENSHOT_FORMAT}"
+        pending = [self.base_dir]
 
-# Singleton instance
-_screenshot_manager: Optional[ScreenshotManager] = None
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        yield entry
 
 
+@functools.cache
 def get_screenshot_manager() -> ScreenshotManager:
     """
     Get the singleton ScreenshotManager instance.
@@ -275,7 +421,4 @@ def get_screenshot_manager() -> ScreenshotManager:
     Returns:
         ScreenshotManager instance.
     """
-    global _screenshot_manager
-    if _screenshot_manager is None:
-        _screenshot_manager = ScreenshotManager()
-    return _screenshot_manager
+    return ScreenshotManager()
@@ -5,13 +5,18 @@ This module provides shared fixtures and configuration for all test modules.
 """
 
 import asyncio
-import os
 from pathlib import Path
 from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    async_playwright,
+)
 
 # Add parent directory to path for imports
 import sys
@@ -21,6 +26,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.bot.linkedin_bot import LinkedInBot
 from src.config.settings import Settings, get_settings
 from src.core.browser_manager import BrowserManager
+from src.utils.logger import disable_file_logging
 
 
 # ============================================================================
@@ -42,20 +48,22 @@ def event_loop() -> Generator:
 
 
 @pytest.fixture(scope="session")
-def test_settings() -> Settings:
+def test_settings() -> Generator[Settings, None, None]:
     """
     Get settings for testing.
 
-    Returns:
+    The testing flag stays set for the whole session and is removed when
+    the session ends.
+
+    Yields:
         Settings instance with test configuration.
     """
-    # Set testing flag
-    os.environ["TESTING"] = "true"
+    with pytest.MonkeyPatch.context() as mp:
+        # Set testing flag
+        mp.setenv("TESTING", "true")
 
-    # Get settings
-    settings = get_settings()
-
-    return settings
+        # Get settings
+        yield get_settings()
 
 
 # ============================================================================
@@ -83,18 +91,34 @@ async def browser_manager(
     BrowserManager.reset_instance()
 
 
-@pytest.fixture(scope="function")
-async def browser() -> AsyncGenerator[Browser, None]:
+@pytest.fixture(scope="session")
+async def playwright() -> AsyncGenerator[Playwright, None]:
     """
-    Create a Playwright browser instance for testing.
+    Start Playwright once for the test session.
 
     Yields:
-        Browser instance.
+        Playwright instance.
     """
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        yield browser
-        await browser.close()
+        yield p
+
+
+@pytest.fixture(scope="session")
+async def browser(playwright: Playwright) -> AsyncGenerator[Browser, None]:
+    """
+    Launch a Playwright browser shared by the whole test session.
+
+    Tests stay isolated through the function-scoped context fixture.
+
+    Args:
+        playwright: Playwright instance.
+
+    Yields:
+        Browser instance.
+    """
+    browser = await playwright.chromium.launch(headless=True)
+    yield browser
+    await browser.close()
 
 
 @pytest.fixture(scope="function")
@@ -193,16 +217,20 @@ def mock_browser_manager() -> Mock:
 
 
 @pytest.fixture
-def mock_settings() -> Settings:
+def mock_settings(monkeypatch: pytest.MonkeyPatch) -> Settings:
     """
     Create mock settings for testing.
 
+    Args:
+        monkeypatch: Pytest monkeypatch fixture, which restores the
+            environment after the test.
+
     Returns:
         Settings instance with test data.
     """
-    os.environ["TESTING"] = "true"
-    os.environ["LINKEDIN_EMAIL"] = "test@example.com"
-    os.environ["LINKEDIN_PASSWORD"] = "test_password"
+    monkeypatch.setenv("TESTING", "true")
+    monkeypatch.setenv("LINKEDIN_EMAIL", "test@example.com")
+    monkeypatch.setenv("LINKEDIN_PASSWORD", "test_password")
 
     settings = Settings()
     return settings
@@ -287,45 +315,15 @@ def test_selectors() -> dict[str, str]:
     }
 
 
-# ============================================================================
-# Cleanup fixtures
-# ============================================================================
-
-
-@pytest.fixture(autouse=True)
-def cleanup_env():
-    """
-    Clean up environment variables after each test.
-
-    Yields:
-        None
-    """
-    yield
-    # Reset testing flag
-    if "TESTING" in os.environ:
-        os.environ.pop("TESTING", None)
-
-
-@pytest.fixture(autouse=True)
-def reset_singletons():
-    """
-    Reset singleton instances after each test.
-
-    Yields:
-        None
-    """
-    yield
-    # Reset BrowserManager singleton (only if safe)
-    # This is handled by individual tests that use browser_manager
-
-
 # ============================================================================
 # Markers
 # ============================================================================
 
 
 def pytest_configure(config):
-    """Configure pytest with custom markers."""
+    """Configure pytest with custom markers and console-only logging."""
+    disable_file_logging()
+
     config.addinivalue_line(
         "markers", "unit: mark test as a unit test (no external dependencies)"
     )
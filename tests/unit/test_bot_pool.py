@@ -0,0 +1,115 @@
+"""Unit tests for the LinkedIn bot pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.bot.bot_pool import LinkedInBotPool
+
+
+def _make_pool(max_concurrent: int = 4) -> LinkedInBotPool:
+    """Create a pool wired to a mocked browser manager."""
+    settings = MagicMock(max_concurrent=max_concurrent)
+    pool = LinkedInBotPool(settings=settings)
+
+    manager = MagicMock()
+    manager.browser = MagicMock()
+    manager.context = None
+    manager.create_context = AsyncMock(side_effect=lambda *_: _make_context())
+    manager.close = AsyncMock()
+    pool.browser_manager = manager
+    return pool
+
+
+def _make_context() -> MagicMock:
+    """Create a mocked browser context."""
+    context = MagicMock()
+    context.new_page = AsyncMock()
+    context.storage_state = AsyncMock()
+    context.close = AsyncMock()
+    return context
+
+
+@pytest.mark.unit
+class TestLinkedInBotPool:
+    """Test concurrent logins in the bot pool."""
+
+    @pytest.fixture(autouse=True)
+    def no_saved_sessions(self, tmp_path):
+        """Keep tests away from real saved sessions and screenshots."""
+        with patch("src.bot.bot_pool.SESSION_DIR", tmp_path), patch(
+            "src.bot.bot_pool.load_saved_session", return_value=None
+        ), patch(
+            "src.bot.bot_pool.ScreenshotManager",
+            side_effect=lambda: MagicMock(flush=AsyncMock()),
+        ):
+            yield
+
+    async def test_login_all_maps_results_by_email(self):
+        """Test each account gets its own result or exception."""
+        pool = _make_pool()
+        error = RuntimeError("boom")
+        outcomes = {"a@example.com": True, "b@example.com": False, "c@example.com": error}
+
+        async def fake_login(email, **kwargs):
+            outcome = outcomes[email]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with patch("src.bot.bot_pool.LoginPage") as login_page_cls:
+            login_page_cls.return_value.login = AsyncMock(side_effect=fake_login)
+            results = await pool.login_all(
+                [(email, "secret") for email in outcomes]
+            )
+
+        assert results == outcomes
+        assert not pool._contexts
+
+    async def test_login_all_respects_max_concurrent(self):
+        """Test the semaphore bounds the number of logins in flight."""
+        pool = _make_pool(max_concurrent=2)
+        active = 0
+        peak = 0
+
+        async def fake_login(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return True
+
+        with patch("src.bot.bot_pool.LoginPage") as login_page_cls:
+            login_page_cls.return_value.login = AsyncMock(side_effect=fake_login)
+            results = await pool.login_all(
+                [(f"user{i}@example.com", "secret") for i in range(6)]
+            )
+
+        assert all(result is True for result in results.values())
+        assert peak == 2
+
+    async def test_each_login_gets_its_own_screenshot_manager(self):
+        """Test concurrent logins never share screenshot dedup state."""
+        pool = _make_pool()
+
+        with patch("src.bot.bot_pool.LoginPage") as login_page_cls:
+            login_page_cls.return_value.login = AsyncMock(return_value=True)
+            await pool.login_all(
+                [("a@example.com", "secret"), ("b@example.com", "secret")]
+            )
+
+        managers = [call.args[1] for call in login_page_cls.call_args_list]
+        assert managers[0] is not managers[1]
+        for manager in managers:
+            manager.flush.assert_awaited_once()
+
+    async def test_cleanup_keeps_browser_it_did_not_launch(self):
+        """Test cleanup leaves a browser launched by someone else running."""
+        pool = _make_pool()
+        pool._owns_browser = False
+
+        await pool.cleanup()
+
+        pool.browser_manager.close.assert_not_awaited()
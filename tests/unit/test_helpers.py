@@ -1,13 +1,33 @@
 """Unit tests for helper utilities."""
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
+from src.utils import helpers
 from src.utils.helpers import (
     generate_random_user_agent,
     generate_realistic_viewport,
+    random_mouse_move,
+    retry_on_exception,
+    split_typing_chunks,
+    track_click,
+    wait_for_click_target,
 )
 
 
+def _always_failing(exc: Exception, **retry_kwargs):
+    """Build a retried coroutine function that always raises exc."""
+    calls = []
+
+    @retry_on_exception(**retry_kwargs)
+    async def operation():
+        calls.append(1)
+        raise exc
+
+    return operation, calls
+
+
 @pytest.mark.unit
 class TestHelpers:
     """Test helper utility functions."""
@@ -29,3 +49,92 @@ class TestHelpers:
         assert isinstance(user_agent, str)
         assert "Mozilla" in user_agent
         assert "Chrome" in user_agent
+
+    def test_split_typing_chunks(self):
+        """Test typing chunk boundaries cover the whole text."""
+        bounds = split_typing_chunks(40)
+
+        assert bounds[0] == 0
+        assert bounds[-1] == 40
+        assert bounds == sorted(set(bounds))
+        assert 3 <= len(bounds) - 1 <= 5
+
+    def test_split_typing_chunks_short_text(self):
+        """Test short text is never split into empty chunks."""
+        assert split_typing_chunks(1) == [0, 1]
+        assert split_typing_chunks(2) == [0, 1, 2]
+        assert split_typing_chunks(0) == [0]
+
+    async def test_retry_giveup_reraises_immediately(self):
+        """Test a non-retryable exception is raised without retrying."""
+        operation, calls = _always_failing(
+            ValueError("bad input"),
+            max_attempts=5,
+            giveup=lambda e: isinstance(e, ValueError),
+        )
+
+        with patch("src.utils.helpers.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            with pytest.raises(ValueError):
+                await operation()
+
+        assert len(calls) == 1
+        sleep.assert_not_awaited()
+
+    async def test_retry_delays_never_exceed_max_delay(self):
+        """Test jittered delays stay within [0, max_delay]."""
+        operation, calls = _always_failing(
+            RuntimeError("flaky"),
+            max_attempts=8,
+            delay=1.0,
+            backoff=10.0,
+            max_delay=3.0,
+        )
+
+        with patch("src.utils.helpers.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            with pytest.raises(RuntimeError):
+                await operation()
+
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert len(calls) == 8
+        assert len(delays) == 7
+        assert all(0.0 <= d <= 3.0 for d in delays)
+
+    async def test_retry_without_jitter_follows_backoff_schedule(self):
+        """Test jitter=False gives the exact capped exponential schedule."""
+        operation, calls = _always_failing(
+            RuntimeError("flaky"),
+            max_attempts=5,
+            delay=1.0,
+            backoff=2.0,
+            max_delay=5.0,
+            jitter=False,
+        )
+
+        with patch("src.utils.helpers.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            with pytest.raises(RuntimeError):
+                await operation()
+
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert delays == [1.0, 2.0, 4.0, 5.0]
+
+    async def test_mouse_move_starts_from_last_click(self, monkeypatch):
+        """Test the cursor path after a click starts at the clicked element."""
+        # Fast mode (set by headless browser tests) skips all mouse movement
+        monkeypatch.setattr(helpers, "_fast_mode", False)
+        page = MagicMock()
+        page.viewport_size = {"width": 1280, "height": 800}
+        page.mouse.move = AsyncMock()
+        element = MagicMock()
+        element.bounding_box = AsyncMock(
+            return_value={"x": 100, "y": 200, "width": 40, "height": 20}
+        )
+        element.wait_for = AsyncMock()
+
+        with patch("src.utils.helpers.asyncio.sleep", new_callable=AsyncMock):
+            box = await wait_for_click_target(element, timeout=1000)
+            track_click(page, box)
+            await random_mouse_move(page, min_steps=2, max_steps=2)
+
+        # Halfway along the eased path lies halfway between click and target
+        midpoint, target = (call.args for call in page.mouse.move.await_args_list)
+        assert midpoint == ((120 + target[0]) / 2, (210 + target[1]) / 2)
@@ -0,0 +1,103 @@
+"""Unit tests for the screenshot manager."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.config.constants import SCREENSHOT_FORMAT
+from src.utils.screenshot_manager import ScreenshotManager
+
+
+def _make_page(*images: bytes) -> MagicMock:
+    """Create a mock page whose screenshots return the given images."""
+    page = MagicMock()
+    page.screenshot = AsyncMock(side_effect=list(images))
+    return page
+
+
+@pytest.mark.unit
+class TestScreenshotManager:
+    """Test screenshot naming, deduplication and sampling."""
+
+    def test_screenshot_name_sanitising(self, tmp_path):
+        """Test unsafe and non-ASCII characters become underscores."""
+        manager = ScreenshotManager(base_dir=tmp_path)
+
+        path = manager.get_screenshot_path("sales nav/err:é", numbered=False)
+
+        assert path.name == f"sales_nav_err__.{SCREENSHOT_FORMAT}"
+        assert path.parent == manager.session_dir
+
+    async def test_unchanged_screenshot_is_not_written_again(self, tmp_path):
+        """Test an identical image reuses the previous file."""
+        manager = ScreenshotManager(base_dir=tmp_path)
+        page = _make_page(b"same", b"same", b"changed")
+
+        first = await manager.capture(page, "first")
+        second = await manager.capture(page, "second")
+        third = await manager.capture(page, "third")
+        await manager.flush()
+
+        assert second == first
+        assert third != first
+        assert len(manager.get_session_screenshots()) == 2
+
+    async def test_dedupe_resets_on_new_session(self, tmp_path):
+        """Test a new session never returns a file from the previous one."""
+        manager = ScreenshotManager(base_dir=tmp_path)
+        page = _make_page(b"same", b"same")
+
+        first = await manager.capture(page, "shot")
+        session_dir = manager.create_session_directory("next_session")
+        second = await manager.capture(page, "shot")
+        await manager.flush()
+
+        assert second != first
+        assert second.parent == session_dir
+        assert second.exists()
+
+    async def test_sampling_captures_one_in_n(self, tmp_path):
+        """Test the accumulator captures exactly every tenth call at p=0.1."""
+        manager = ScreenshotManager(base_dir=tmp_path, sample_prob=0.1)
+        page = _make_page(*(b"image %d" % i for i in range(2)))
+
+        results = [await manager.capture(page, f"shot_{i}") for i in range(20)]
+        await manager.flush()
+
+        captured = [i for i, result in enumerate(results) if result is not None]
+        assert captured == [9, 19]
+
+    async def test_force_bypasses_sampling(self, tmp_path):
+        """Test forced captures ignore and don't consume the sampling budget."""
+        manager = ScreenshotManager(base_dir=tmp_path)
+        manager.set_sample_prob(0.5)
+        page = _make_page(b"forced", b"sampled")
+
+        assert await manager.capture(page, "forced", force=True) is not None
+        assert await manager.capture(page, "skipped") is None
+        assert await manager.capture(page, "sampled") is not None
+        await manager.flush()
+
+    async def test_capture_sequence_writes_every_shot(self, tmp_path):
+        """Test a sequence of an unchanged page still yields one file per shot."""
+        manager = ScreenshotManager(base_dir=tmp_path, sample_prob=0.5)
+        page = _make_page(b"same", b"same", b"same")
+
+        paths = await manager.capture_sequence(page, "seq", 3)
+        await manager.flush()
+
+        assert len(set(paths)) == 3
+        assert [path.name.rsplit("_", 1)[0] for path in paths] == [
+            "seq_01",
+            "seq_02",
+            "seq_03",
+        ]
+        assert all(path.exists() for path in paths)
+
+    @pytest.mark.parametrize("sample_prob", [0.0, -0.5, 1.5])
+    def test_set_sample_prob_rejects_out_of_range(self, tmp_path, sample_prob):
+        """Test sampling rates outside (0, 1] are rejected."""
+        manager = ScreenshotManager(base_dir=tmp_path)
+
+        with pytest.raises(ValueError):
+            manager.set_sample_prob(sample_prob)